@@ -240,4 +240,5 @@ app.on("will-quit", () => {
   globalShortcut.unregisterAll();
   globeKeyManager.stop();
   updateManager.cleanup();
+  whisperManager.stopMlxServer();
 });
@@ -1,5 +1,6 @@
 const { spawn } = require("child_process");
 const fs = require("fs");
+const net = require("net");
 const fsPromises = require("fs").promises;
 const os = require("os");
 const path = require("path");
@@ -16,6 +17,9 @@ class WhisperManager {
     this.useMlx = false; // Use MLX (GPU) by default if available
     this.isInitialized = false;
     this.currentDownloadProcess = null;
+    this.mlxServerProcess = null;
+    this.mlxServerReady = null; // Resolves to the socket path once the MLX server accepts requests
+    this.mlxServerFailed = false; // Stop retrying the server after it fails to start
     this.pythonInstaller = new PythonInstaller();
     this.cachedFFmpegPath = null;
     this.cachedFFmpegAvailability = null; // Cache FFmpeg availability check result
@@ -430,6 +434,230 @@ class WhisperManager {
     return candidates;
   }
 
+  async getWhisperProcessEnv() {
+    const ffmpegPath = await this.getFFmpegPath();
+    if (!ffmpegPath) {
+      throw new Error('FFmpeg not found. Please ensure FFmpeg is installed or bundled correctly.');
+    }
+
+    let effectiveFfmpegPath = ffmpegPath;
+    if (effectiveFfmpegPath.includes("app.asar") && !effectiveFfmpegPath.includes("app.asar.unpacked")) {
+      const unpackedPath = effectiveFfmpegPath.replace("app.asar", "app.asar.unpacked");
+      if (fs.existsSync(unpackedPath)) {
+        effectiveFfmpegPath = unpackedPath;
+        debugLogger.log('Using unpacked FFmpeg path:', unpackedPath);
+      }
+    }
+
+    const absoluteFFmpegPath = path.resolve(effectiveFfmpegPath);
+    const enhancedEnv = {
+      ...process.env,
+      FFMPEG_PATH: absoluteFFmpegPath,
+      FFMPEG_EXECUTABLE: absoluteFFmpegPath,
+      FFMPEG_BINARY: absoluteFFmpegPath,
+    };
+
+    debugLogger.logFFmpegDebug('Setting FFmpeg env vars', absoluteFFmpegPath);
+
+    // Add ffmpeg directory to PATH if we have a valid path
+    if (ffmpegPath) {
+      const ffmpegDir = path.dirname(absoluteFFmpegPath);
+      const currentPath = enhancedEnv.PATH || "";
+      const pathSeparator = process.platform === "win32" ? ";" : ":";
+
+      if (!currentPath.includes(ffmpegDir)) {
+        enhancedEnv.PATH = `${ffmpegDir}${pathSeparator}${currentPath}`;
+      }
+    }
+    
+    // Add common system paths for macOS GUI launches
+    if (process.platform === "darwin") {
+      const commonPaths = [
+        "/usr/local/bin",
+        "/opt/homebrew/bin",
+        "/opt/homebrew/sbin",
+        "/usr/bin",
+        "/bin",
+        "/usr/sbin",
+        "/sbin"
+      ];
+      
+      const currentPath = enhancedEnv.PATH || "";
+      const pathsToAdd = commonPaths.filter(p => !currentPath.includes(p));
+      
+      if (pathsToAdd.length > 0) {
+        enhancedEnv.PATH = `${currentPath}:${pathsToAdd.join(":")}`;
+        debugLogger.log('Added system paths for GUI launch');
+      }
+    }
+
+    return enhancedEnv;
+  }
+
+  getMlxSocketPath() {
+    return path.join(os.homedir(), ".cache", "openwhispr", "mlx.sock");
+  }
+
+  ensureMlxServer() {
+    if (!this.mlxServerReady) {
+      this.mlxServerReady = this.startMlxServer().catch((error) => {
+        this.mlxServerReady = null;
+        this.mlxServerFailed = true;
+        throw error;
+      });
+    }
+    return this.mlxServerReady;
+  }
+
+  async startMlxServer() {
+    const startTime = Date.now();
+    const pythonCmd = await this.findPythonExecutable();
+    const whisperScriptPath = this.getWhisperScriptPath(true);
+    const enhancedEnv = await this.getWhisperProcessEnv();
+    const socketPath = this.getMlxSocketPath();
+
+    const args = [whisperScriptPath, "--mode", "serve", "--socket", socketPath];
+    if (debugLogger.isDebugEnabled()) {
+      args.push("--verbose");
+    }
+
+    debugLogger.logProcessStart(pythonCmd, args, { env: enhancedEnv });
+
+    const serverProcess = spawn(pythonCmd, args, {
+      stdio: ["ignore", "pipe", "pipe"],
+      windowsHide: true,
+      env: enhancedEnv,
+    });
+    this.mlxServerProcess = serverProcess;
+
+    return new Promise((resolve, reject) => {
+      let stdout = "";
+      let startupLog = "";
+      let isSettled = false;
+
+      const settle = (error) => {
+        if (isSettled) return;
+        isSettled = true;
+        clearTimeout(timeout);
+        if (error) {
+          reject(error);
+          return;
+        }
+        console.log(`[TIMING:NODE] MLX server ready in ${Date.now() - startTime}ms`);
+        resolve(socketPath);
+      };
+
+      const timeout = setTimeout(() => {
+        serverProcess.kill("SIGTERM");
+        settle(new Error("MLX server did not start in time"));
+      }, 60000);
+
+      serverProcess.stdout.on("data", (data) => {
+        stdout += data.toString();
+      });
+
+      serverProcess.stderr.on("data", (data) => {
+        const stderrText = data.toString();
+        debugLogger.logProcessOutput('MLX server', 'stderr', data);
+
+        if (stderrText.includes('[MLX]')) {
+          console.log(stderrText.trim());
+        }
+
+        if (!isSettled) {
+          startupLog += stderrText;
+          if (startupLog.includes("[MLX] Serving on")) {
+            settle();
+          }
+        }
+      });
+
+      serverProcess.on("close", (code) => {
+        const isCurrent = this.mlxServerProcess === serverProcess;
+        if (isCurrent) {
+          this.mlxServerProcess = null;
+        }
+
+        // A server left running by an earlier session still owns the socket; use it
+        if (!isSettled && stdout.includes("already serving")) {
+          settle();
+          return;
+        }
+
+        if (isCurrent && isSettled) {
+          // Stopped after starting up; start a new one on the next request
+          this.mlxServerReady = null;
+        }
+        settle(new Error(`MLX server exited (code ${code}): ${startupLog.trim()}`));
+      });
+
+      serverProcess.on("error", (error) => {
+        settle(new Error(`MLX server process error: ${error.message}`));
+      });
+    });
+  }
+
+  async runMlxServerRequest(tempAudioPath, model, language) {
+    const startTime = Date.now();
+    const socketPath = await this.ensureMlxServer();
+
+    return new Promise((resolve, reject) => {
+      let response = "";
+      let isResolved = false;
+
+      const finish = (error, result) => {
+        if (isResolved) return;
+        isResolved = true;
+        clearTimeout(timeout);
+        client.destroy();
+        if (error) {
+          reject(error);
+        } else {
+          resolve(result);
+        }
+      };
+
+      const client = net.createConnection(socketPath);
+
+      const timeout = setTimeout(() => {
+        finish(new Error("Whisper transcription timed out"));
+      }, 1200000);
+
+      client.on("connect", () => {
+        client.write(`${JSON.stringify({ audio_file: tempAudioPath, model, language })}\n`);
+      });
+
+      client.on("data", (data) => {
+        response += data.toString();
+        const newline = response.indexOf("\n");
+        if (newline !== -1) {
+          console.log(`[TIMING:NODE] ✅ MLX server request completed in ${Date.now() - startTime}ms`);
+          finish(null, response.slice(0, newline));
+        }
+      });
+
+      client.on("error", (error) => {
+        if (error.code === "ENOENT" || error.code === "ECONNREFUSED") {
+          // The server is gone; start a new one next time
+          this.mlxServerReady = null;
+        }
+        finish(new Error(`MLX server request failed: ${error.message}`));
+      });
+
+      client.on("close", () => {
+        finish(new Error("MLX server closed the connection before replying"));
+      });
+    });
+  }
+
+  stopMlxServer() {
+    if (this.mlxServerProcess) {
+      this.mlxServerProcess.kill("SIGTERM");
+      this.mlxServerProcess = null;
+    }
+    this.mlxServerReady = null;
+  }
+
   async runWhisperProcess(tempAudioPath, model, language) {
     const startTime = Date.now();
     console.log(`[TIMING:NODE] runWhisperProcess() started (model: ${model})`);
@@ -441,70 +669,25 @@ class WhisperManager {
       throw new Error(`Whisper script not found at: ${whisperScriptPath}`);
     }
 
+    if (this.useMlx && this.mlxInstalled?.installed && !this.mlxServerFailed) {
+      try {
+        return await this.runMlxServerRequest(tempAudioPath, model, language);
+      } catch (error) {
+        // Fall back to a one-off process so a broken server never blocks transcription
+        debugLogger.log('MLX server unavailable, spawning a one-off process:', error.message);
+      }
+    }
+
     const args = [whisperScriptPath, tempAudioPath, "--model", model];
     if (language) {
       args.push("--language", language);
     }
     args.push("--output-format", "json");
 
-    return new Promise(async (resolve, reject) => {
-      const spawnStartTime = Date.now();
-      const ffmpegPath = await this.getFFmpegPath();
-      if (!ffmpegPath) {
-        reject(new Error('FFmpeg not found. Please ensure FFmpeg is installed or bundled correctly.'));
-        return;
-      }
-
-      let effectiveFfmpegPath = ffmpegPath;
-      if (effectiveFfmpegPath.includes("app.asar") && !effectiveFfmpegPath.includes("app.asar.unpacked")) {
-        const unpackedPath = effectiveFfmpegPath.replace("app.asar", "app.asar.unpacked");
-        if (fs.existsSync(unpackedPath)) {
-          effectiveFfmpegPath = unpackedPath;
-          debugLogger.log('Using unpacked FFmpeg path:', unpackedPath);
-        }
-      }
-
-      const absoluteFFmpegPath = path.resolve(effectiveFfmpegPath);
-      const enhancedEnv = {
-        ...process.env,
-        FFMPEG_PATH: absoluteFFmpegPath,
-        FFMPEG_EXECUTABLE: absoluteFFmpegPath,
-        FFMPEG_BINARY: absoluteFFmpegPath,
-      };
-
-      debugLogger.logFFmpegDebug('Setting FFmpeg env vars', absoluteFFmpegPath);
+    const enhancedEnv = await this.getWhisperProcessEnv();
 
-      // Add ffmpeg directory to PATH if we have a valid path
-      if (ffmpegPath) {
-        const ffmpegDir = path.dirname(absoluteFFmpegPath);
-        const currentPath = enhancedEnv.PATH || "";
-        const pathSeparator = process.platform === "win32" ? ";" : ":";
-
-        if (!currentPath.includes(ffmpegDir)) {
-          enhancedEnv.PATH = `${ffmpegDir}${pathSeparator}${currentPath}`;
-        }
-      }
-      
-      // Add common system paths for macOS GUI launches
-      if (process.platform === "darwin") {
-        const commonPaths = [
-          "/usr/local/bin",
-          "/opt/homebrew/bin",
-          "/opt/homebrew/sbin",
-          "/usr/bin",
-          "/bin",
-          "/usr/sbin",
-          "/sbin"
-        ];
-        
-        const currentPath = enhancedEnv.PATH || "";
-        const pathsToAdd = commonPaths.filter(p => !currentPath.includes(p));
-        
-        if (pathsToAdd.length > 0) {
-          enhancedEnv.PATH = `${currentPath}:${pathsToAdd.join(":")}`;
-          debugLogger.log('Added system paths for GUI launch');
-        }
-      }
+    return new Promise((resolve, reject) => {
+      const spawnStartTime = Date.now();
 
       debugLogger.logProcessStart(pythonCmd, args, { env: enhancedEnv });
 
@@ -168,7 +168,7 @@ def monitor_download_progress(model_name, expected_size, stop_event):
     os.makedirs(cache_dir, exist_ok=True)
     
     last_size = 0
-    last_update_time = time.time()
+    last_update_time = time.perf_counter()
     speed_samples = []
     last_progress_update = 0
     
@@ -178,7 +178,7 @@ def monitor_download_progress(model_name, expected_size, stop_event):
             if os.path.exists(model_file):
                 current_size = os.path.getsize(model_file)
             
-            current_time = time.time()
+            current_time = time.perf_counter()
             time_diff = current_time - last_update_time
             
             speed_mbps = 0
@@ -9,6 +9,9 @@ import sys
 import json
 import os
 import argparse
+import shutil
+import time
+from functools import lru_cache
 from pathlib import Path
 
 try:
@@ -66,8 +69,6 @@ def load_model(model_name="base", allow_quantization=True):
 
 def transcribe_audio(audio_file, model_name="base", language=None):
     """Transcribe audio file with MLX GPU acceleration (full precision)"""
-    import time
-
     if not os.path.exists(audio_file):
         return {
             "success": False,
@@ -77,7 +78,7 @@ def transcribe_audio(audio_file, model_name="base", language=None):
     # Use full precision (8-bit quantization disabled due to library incompatibility)
     try:
         print(f"[MLX] Starting transcription with model: {model_name}", file=sys.stderr)
-        start_time = time.time()
+        start_time = time.perf_counter()
 
         model, cache_key = load_model(model_name, allow_quantization=False)
         if model is None:
@@ -86,13 +87,13 @@ def transcribe_audio(audio_file, model_name="base", language=None):
                 "error": f"Failed to load model: {model_name}"
             }
 
-        load_time = time.time() - start_time
+        load_time = time.perf_counter() - start_time
         print(f"[MLX] Model loaded in {load_time:.2f}s (full precision)", file=sys.stderr)
 
         # Transcribe with MLX (GPU accelerated)
-        transcribe_start = time.time()
+        transcribe_start = time.perf_counter()
         result = model.transcribe(audio_file, language=language)
-        transcribe_time = time.time() - transcribe_start
+        transcribe_time = time.perf_counter() - transcribe_start
 
         # Validate result
         text = result.get("text", "").strip()
@@ -102,7 +103,7 @@ def transcribe_audio(audio_file, model_name="base", language=None):
                 "error": "Transcription produced no text"
             }
 
-        total_time = time.time() - start_time
+        total_time = time.perf_counter() - start_time
         print(f"[MLX] Transcription completed in {transcribe_time:.2f}s (total: {total_time:.2f}s)", file=sys.stderr)
         print(f"[MLX] GPU/Neural Engine acceleration (full precision)", file=sys.stderr)
 
@@ -124,10 +125,9 @@ def transcribe_audio(audio_file, model_name="base", language=None):
             "error": f"Transcription failed: {str(e)}"
         }
 
+@lru_cache(maxsize=1)
 def check_ffmpeg():
     """Check if FFmpeg is available"""
-    import subprocess
-
     # Check for FFmpeg in environment variables first
     ffmpeg_paths = [
         os.environ.get('FFMPEG_PATH'),
@@ -140,19 +140,13 @@ def check_ffmpeg():
         if not ffmpeg_path:
             continue
 
-        try:
-            result = subprocess.run(
-                [ffmpeg_path, '-version'],
-                capture_output=True,
-                timeout=5
-            )
-            if result.returncode == 0:
-                return {
-                    "available": True,
-                    "path": ffmpeg_path
-                }
-        except (subprocess.TimeoutExpired, FileNotFoundError, PermissionError):
-            continue
+        # Existence + executable check, no need to spawn ffmpeg itself
+        resolved = shutil.which(ffmpeg_path)
+        if resolved:
+            return {
+                "available": True,
+                "path": resolved
+            }
 
     return {
         "available": False,
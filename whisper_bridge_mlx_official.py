@@ -9,16 +9,51 @@ import sys
 import json
 import os
 import argparse
+import asyncio
+import importlib.util
 import shutil
+import signal
+import socket
 import threading
 import time
+import traceback
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from pathlib import Path
 
+# Use the multi-connection hf_transfer downloader when it is installed
+# (pip install hf_transfer). It can saturate the CPU on fast links; set
+# HF_HUB_ENABLE_HF_TRANSFER=0 to opt out. Must be set before importing huggingface_hub.
+if importlib.util.find_spec("hf_transfer") is not None:
+    os.environ.setdefault("HF_HUB_ENABLE_HF_TRANSFER", "1")
+
+# Use orjson for the JSON protocol when it is installed (pip install orjson)
 try:
-    import mlx_whisper
-    from huggingface_hub import snapshot_download
+    import orjson
+
+    _loads = orjson.loads
+    _dumpb = orjson.dumps
+
+    def _dumps(obj):
+        return orjson.dumps(obj).decode("utf-8")
+except ImportError:
+    _loads = json.loads
+    _dumps = json.dumps
+
+    def _dumpb(obj):
+        return json.dumps(obj).encode("utf-8")
+
+try:
+    import mlx.core as mx
+    from mlx_whisper.audio import N_FRAMES, N_SAMPLES, load_audio, log_mel_spectrogram, pad_or_trim
+    from mlx_whisper.decoding import DecodingOptions, decode
+    from mlx_whisper.transcribe import ModelHolder, transcribe as mlx_transcribe
+    from huggingface_hub import HfApi, __version__ as hub_version, snapshot_download
+    from huggingface_hub.utils import filter_repo_objects, tqdm as hf_tqdm
+    from packaging.version import Version
 except ImportError as e:
-    print(json.dumps({
+    print(_dumps({
         "success": False,
         "error": f"Required libraries not installed: {str(e)}. Run: pip install mlx-whisper huggingface-hub"
     }))
@@ -45,10 +80,113 @@ MODEL_MAPPING = {
     "large-8bit": "mlx-community/whisper-large-v3-mlx-8bit",
 }
 
-def transcribe_audio(audio_file, model_name="base", language=None):
-    """Transcribe audio file using official mlx-whisper"""
-    import time
+# Default to the 4-bit turbo model: decoding on Apple Silicon is bound by the
+# bytes of weights read per step, and Metal dequantizes INT4 inside the matmul,
+# so q4 runs fastest at a small accuracy cost versus full-precision turbo.
+DEFAULT_MODEL = "turbo-q4"
+
+# --quality presets, from fastest to most accurate
+QUALITY_PROFILE = {
+    "fast": "turbo-q4",
+    "balanced": "turbo",
+    "quality": "large-v3",
+}
+
+# Repo used when a model name isn't in MODEL_MAPPING
+FALLBACK_REPO = "mlx-community/whisper-base"
+
+def _describe_backend(hf_repo):
+    """Determine backend type from the model repo"""
+    if "q4" in hf_repo:
+        return "mlx-official-q4", "4-bit quantized"
+    elif "8bit" in hf_repo:
+        return "mlx-official-8bit", "8-bit quantized"
+    elif "turbo" in hf_repo:
+        return "mlx-official-turbo", "4-layer turbo"
+    else:
+        return "mlx-official", "full precision"
+
+# (backend, note) per repo, computed once instead of per transcription
+BACKENDS = {hf_repo: _describe_backend(hf_repo) for hf_repo in MODEL_MAPPING.values()}
+
+def resolve_model(model_name):
+    """Map a UI model name to its HuggingFace repo"""
+    hf_repo = MODEL_MAPPING.get(model_name)
+    if hf_repo is None:
+        print(f"[MLX] Unknown model '{model_name}', falling back to {FALLBACK_REPO}", file=sys.stderr)
+        return FALLBACK_REPO
+    return hf_repo
+
+# mlx-whisper only reads config.json and weights.{safetensors,npz}; skip any
+# PyTorch checkpoints or extras that some mlx-community repos also carry
+DOWNLOAD_ALLOW_PATTERNS = ["*.json", "*.txt", "weights*.safetensors", "weights*.npz", "tokenizer*", "mel_filters*.npz"]
+DOWNLOAD_IGNORE_PATTERNS = ["*.bin", "*.pt", "original/*"]
+
+# Approximate download sizes, used for progress until the Hub reports exact ones
+ESTIMATED_DOWNLOAD_SIZES = {
+    "tiny": 80 * 1024 * 1024,
+    "base": 150 * 1024 * 1024,
+    "small": 500 * 1024 * 1024,
+    "medium": 1500 * 1024 * 1024,
+    "large": 3000 * 1024 * 1024,
+    "large-v3": 3000 * 1024 * 1024,
+    "turbo": 1600 * 1024 * 1024,
+    "large-v3-turbo": 1600 * 1024 * 1024,
+    "turbo-q4": 500 * 1024 * 1024,
+    "base-8bit": 100 * 1024 * 1024,
+    "medium-8bit": 800 * 1024 * 1024,
+    "large-8bit": 1600 * 1024 * 1024,
+}
+DEFAULT_DOWNLOAD_ESTIMATE = 1000 * 1024 * 1024
+
+# Parallel file downloads for snapshot_download
+DOWNLOAD_MAX_WORKERS = 8
+
+# snapshot_download reports downloaded bytes to its tqdm_class from huggingface_hub
+# 1.1 on; older versions only count files there, so progress polls blob sizes instead
+HUB_REPORTS_BYTES = Version(hub_version) >= Version("1.1.0")
+
+# Bytes per second in one Mbps (as reported in progress speed_mbps)
+BYTES_PER_MBPS = 1024 * 1024 / 8
+
+# Max clips encoded together by transcribe_batch
+BATCH_MAX_SIZE = 8
+
+# transcribe()'s default quality checks, applied to batch-decoded clips
+COMPRESSION_RATIO_THRESHOLD = 2.4
+LOGPROB_THRESHOLD = -1.0
+NO_SPEECH_THRESHOLD = 0.6
+
+# Default socket for --mode serve
+DEFAULT_SOCKET_PATH = os.path.expanduser("~/.cache/openwhispr/mlx.sock")
 
+def get_snapshot_path(hf_repo):
+    """Local snapshot directory for a repo, fetched with the download-mode file filters"""
+    # mlx-whisper's own loader would snapshot_download the whole repo unfiltered
+    download_kwargs = {
+        "repo_id": hf_repo,
+        "cache_dir": _cache_dir(),
+        "allow_patterns": DOWNLOAD_ALLOW_PATTERNS,
+        "ignore_patterns": DOWNLOAD_IGNORE_PATTERNS,
+    }
+    try:
+        return snapshot_download(local_files_only=True, **download_kwargs)
+    except Exception:
+        return snapshot_download(max_workers=DOWNLOAD_MAX_WORKERS, **download_kwargs)
+
+def load_model(hf_repo):
+    """Load MLX Whisper weights once per repo and reuse them across calls"""
+    model_path = get_snapshot_path(hf_repo)
+    if ModelHolder.model_path != model_path:
+        print(f"[MLX] Loading model weights: {hf_repo}", file=sys.stderr)
+
+    # transcribe() reads the same holder, which keeps only one model in memory;
+    # fp16 matches the model it would load (its fp16 option defaults to True)
+    model = ModelHolder.get_model(model_path, mx.float16)
+    return model, model_path
+
+def transcribe_audio(audio_file, model_name=DEFAULT_MODEL, language=None, verbose=False):
+    """Transcribe audio file using official mlx-whisper"""
     if not os.path.exists(audio_file):
         return {
             "success": False,
@@ -57,20 +195,24 @@ def transcribe_audio(audio_file, model_name="base", language=None):
 
     try:
         print(f"[MLX] Starting transcription with model: {model_name}", file=sys.stderr)
-        start_time = time.time()
+        start_time = time.perf_counter()
 
         # Get HuggingFace model repo
-        hf_repo = MODEL_MAPPING.get(model_name, "mlx-community/whisper-base")
+        hf_repo = resolve_model(model_name)
         print(f"[MLX] Using HuggingFace model: {hf_repo}", file=sys.stderr)
 
+        load_start = time.perf_counter()
+        _, model_path = load_model(hf_repo)
+        load_time = time.perf_counter() - load_start
+
         # Transcribe using mlx-whisper
-        transcribe_start = time.time()
-        result = mlx_whisper.transcribe(
+        transcribe_start = time.perf_counter()
+        result = mlx_transcribe(
             audio_file,
-            path_or_hf_repo=hf_repo,
+            path_or_hf_repo=model_path,
             language=language
         )
-        transcribe_time = time.time() - transcribe_start
+        transcribe_time = time.perf_counter() - transcribe_start
 
         # Extract text
         text = result.get("text", "").strip()
@@ -80,21 +222,9 @@ def transcribe_audio(audio_file, model_name="base", language=None):
                 "error": "Transcription produced no text"
             }
 
-        total_time = time.time() - start_time
-
-        # Determine backend type from model name
-        if "q4" in model_name or "q4" in hf_repo:
-            backend = "mlx-official-q4"
-            speedup_note = "4-bit quantized"
-        elif "8bit" in model_name or "8bit" in hf_repo:
-            backend = "mlx-official-8bit"
-            speedup_note = "8-bit quantized"
-        elif "turbo" in model_name or "turbo" in hf_repo:
-            backend = "mlx-official-turbo"
-            speedup_note = "4-layer turbo"
-        else:
-            backend = "mlx-official"
-            speedup_note = "full precision"
+        total_time = time.perf_counter() - start_time
+
+        backend, speedup_note = BACKENDS[hf_repo]
 
         print(f"[MLX] Transcription completed in {transcribe_time:.2f}s (total: {total_time:.2f}s)", file=sys.stderr)
         print(f"[MLX] Official mlx-whisper GPU acceleration ({speedup_note})", file=sys.stderr)
@@ -106,6 +236,7 @@ def transcribe_audio(audio_file, model_name="base", language=None):
             "backend": backend,
             "model_repo": hf_repo,
             "timing": {
+                "load_time": load_time,
                 "transcribe_time": transcribe_time,
                 "total_time": total_time
             }
@@ -113,17 +244,154 @@ def transcribe_audio(audio_file, model_name="base", language=None):
 
     except Exception as e:
         print(f"[MLX] Transcription failed: {str(e)}", file=sys.stderr)
-        import traceback
-        traceback.print_exc(file=sys.stderr)
+        if verbose:
+            traceback.print_exc(file=sys.stderr)
         return {
             "success": False,
             "error": f"Transcription failed: {str(e)}"
         }
 
+def _clip_result(text, detected_language, language):
+    """Per-clip entry in transcribe_batch results"""
+    if not text:
+        return {
+            "success": False,
+            "error": "Transcription produced no text"
+        }
+    return {
+        "success": True,
+        "text": text,
+        "language": detected_language or language or "en"
+    }
+
+def transcribe_batch(audio_files, model_name=DEFAULT_MODEL, language=None, verbose=False):
+    """Transcribe several short clips, sharing one encoder pass per batch"""
+    if not isinstance(audio_files, list):
+        return {
+            "success": False,
+            "error": "audio_files must be a list of paths"
+        }
+
+    try:
+        print(f"[MLX] Starting batch transcription of {len(audio_files)} files with model: {model_name}", file=sys.stderr)
+        start_time = time.perf_counter()
+
+        hf_repo = resolve_model(model_name)
+
+        load_start = time.perf_counter()
+        model, model_path = load_model(hf_repo)
+        load_time = time.perf_counter() - load_start
+
+        transcribe_start = time.perf_counter()
+        results = [None] * len(audio_files)
+        clips = []
+
+        def transcribe_clip(index, audio):
+            """Run one already-loaded clip through transcribe()'s full pipeline"""
+            try:
+                result = mlx_transcribe(audio, path_or_hf_repo=model_path, language=language)
+                results[index] = _clip_result(result.get("text", "").strip(), result.get("language"), language)
+            except Exception as e:
+                print(f"[MLX] Transcription of {audio_files[index]} failed: {str(e)}", file=sys.stderr)
+                results[index] = {
+                    "success": False,
+                    "error": f"Transcription failed: {str(e)}"
+                }
+
+        for index, audio_file in enumerate(audio_files):
+            if not os.path.exists(audio_file):
+                results[index] = {
+                    "success": False,
+                    "error": f"Audio file not found: {audio_file}"
+                }
+                continue
+
+            try:
+                audio = load_audio(audio_file)
+                if audio.shape[0] > N_SAMPLES:
+                    # Longer than one 30s window, needs transcribe()'s seek loop
+                    transcribe_clip(index, audio)
+                    continue
+
+                # Same window transcribe() decodes: the mel of the audio padded with
+                # 30s of silence, cut to the clip's own frames and padded to N_FRAMES
+                mel = log_mel_spectrogram(audio, n_mels=model.dims.n_mels, padding=N_SAMPLES)
+                content_frames = mel.shape[-2] - N_FRAMES
+                mel = pad_or_trim(mel[:content_frames], N_FRAMES, axis=-2).astype(mx.float16)
+                clips.append((index, audio, mel))
+            except Exception as e:
+                # One unreadable clip shouldn't discard the rest of the batch
+                print(f"[MLX] Could not read {audio_file}: {str(e)}", file=sys.stderr)
+                results[index] = {
+                    "success": False,
+                    "error": f"Transcription failed: {str(e)}"
+                }
+
+        options = DecodingOptions(language=language, without_timestamps=True)
+        retries = []
+        for offset in range(0, len(clips), BATCH_MAX_SIZE):
+            batch = clips[offset:offset + BATCH_MAX_SIZE]
+            try:
+                decoded = decode(model, mx.stack([mel for _, _, mel in batch]), options)
+            except Exception as e:
+                # Keep the groups already decoded; fail only this one
+                print(f"[MLX] Batch decode failed: {str(e)}", file=sys.stderr)
+                for index, _, _ in batch:
+                    results[index] = {
+                        "success": False,
+                        "error": f"Transcription failed: {str(e)}"
+                    }
+                continue
+
+            for (index, audio, _), result in zip(batch, decoded):
+                silent = result.no_speech_prob > NO_SPEECH_THRESHOLD
+                if not silent and (result.compression_ratio > COMPRESSION_RATIO_THRESHOLD or
+                                   result.avg_logprob < LOGPROB_THRESHOLD):
+                    # Greedy decoding failed transcribe()'s checks; let it retry
+                    # the clip with its temperature fallback
+                    retries.append((index, audio))
+                    continue
+
+                if silent and result.avg_logprob <= LOGPROB_THRESHOLD:
+                    text = ""  # transcribe() skips windows it judges to be silence
+                else:
+                    text = result.text.strip()
+                results[index] = _clip_result(text, result.language, language)
+
+        for index, audio in retries:
+            transcribe_clip(index, audio)
+
+        transcribe_time = time.perf_counter() - transcribe_start
+        total_time = time.perf_counter() - start_time
+        backend, speedup_note = BACKENDS[hf_repo]
+
+        print(f"[MLX] Batch transcription completed in {transcribe_time:.2f}s (total: {total_time:.2f}s)", file=sys.stderr)
+        print(f"[MLX] Official mlx-whisper GPU acceleration ({speedup_note})", file=sys.stderr)
+
+        return {
+            "success": True,
+            "results": results,
+            "backend": backend,
+            "model_repo": hf_repo,
+            "timing": {
+                "load_time": load_time,
+                "transcribe_time": transcribe_time,
+                "total_time": total_time
+            }
+        }
+
+    except Exception as e:
+        print(f"[MLX] Batch transcription failed: {str(e)}", file=sys.stderr)
+        if verbose:
+            traceback.print_exc(file=sys.stderr)
+        return {
+            "success": False,
+            "error": f"Batch transcription failed: {str(e)}"
+        }
+
+@lru_cache(maxsize=1)
 def check_ffmpeg():
     """Check if FFmpeg is available"""
-    import subprocess
-
     # Check for FFmpeg in environment variables first
     ffmpeg_paths = [
         os.environ.get('FFMPEG_PATH'),
@@ -136,132 +404,227 @@ def check_ffmpeg():
         if not ffmpeg_path:
             continue
 
-        try:
-            result = subprocess.run(
-                [ffmpeg_path, '-version'],
-                capture_output=True,
-                timeout=5
-            )
-            if result.returncode == 0:
-                return {
-                    "available": True,
-                    "path": ffmpeg_path
-                }
-        except (subprocess.TimeoutExpired, FileNotFoundError, PermissionError):
-            continue
+        # Existence + executable check, no need to spawn ffmpeg itself
+        resolved = shutil.which(ffmpeg_path)
+        if resolved:
+            return {
+                "available": True,
+                "path": resolved
+            }
 
     return {
         "available": False,
         "error": "FFmpeg not found in PATH or environment variables"
     }
 
-def monitor_download_progress(model_name, hf_repo, stop_event):
-    """Monitor download progress by watching directory size growth"""
-    cache_dir = os.path.expanduser("~/.cache/huggingface/hub")
-    repo_folder = f"models--{hf_repo.replace('/', '--')}"
-    repo_path = os.path.join(cache_dir, repo_folder)
-
-    # Estimate expected size based on model type
-    expected_sizes = {
-        "tiny": 80 * 1024 * 1024,
-        "base": 150 * 1024 * 1024,
-        "small": 500 * 1024 * 1024,
-        "medium": 1500 * 1024 * 1024,
-        "large": 3000 * 1024 * 1024,
-        "turbo": 1600 * 1024 * 1024,
-        "turbo-q4": 500 * 1024 * 1024,
-        "base-8bit": 100 * 1024 * 1024,
-        "medium-8bit": 800 * 1024 * 1024,
-        "large-8bit": 1600 * 1024 * 1024,
-    }
-    expected_size = expected_sizes.get(model_name, 1000 * 1024 * 1024)
-
-    last_size = 0
-    last_update_time = time.time()
-    speed_samples = []
-    last_progress_update = 0
-
-    while not stop_event.is_set():
+def emit_progress(data):
+    """Write a PROGRESS: line for the app to stderr"""
+    # Bypass print() and stderr's text layer when there is a byte buffer;
+    # windowed launchers or replaced streams may not provide one
+    buffer = getattr(sys.stderr, "buffer", None)
+    if buffer is None:
+        if sys.stderr is not None:
+            print(f"PROGRESS:{_dumps(data)}", file=sys.stderr, flush=True)
+        return
+
+    buffer.write(b"PROGRESS:" + _dumpb(data) + b"\n")
+    buffer.flush()
+
+@lru_cache(maxsize=None)
+def _cache_dir():
+    """HuggingFace hub cache directory"""
+    return os.path.expanduser("~/.cache/huggingface/hub")
+
+@lru_cache(maxsize=None)
+def _repo_path(hf_repo):
+    """Cache folder HuggingFace uses for a model repo"""
+    return os.path.join(_cache_dir(), f"models--{hf_repo.replace('/', '--')}")
+
+def _dir_size(path):
+    """Total size of all files under path, one stat per entry via os.scandir"""
+    total = 0
+    stack = [path]
+    while stack:
+        current = stack.pop()
         try:
-            current_size = 0
-            if os.path.exists(repo_path):
-                # Calculate directory size
-                for dirpath, dirnames, filenames in os.walk(repo_path):
-                    for filename in filenames:
-                        filepath = os.path.join(dirpath, filename)
-                        try:
-                            current_size += os.path.getsize(filepath)
-                        except (OSError, FileNotFoundError):
-                            pass
-
-            # Calculate speed
-            current_time = time.time()
-            time_diff = current_time - last_update_time
-
-            speed_mbps = 0
-            if last_size > 0 and time_diff > 0 and current_size > last_size:
-                bytes_per_second = (current_size - last_size) / time_diff
-                speed_mbps = (bytes_per_second * 8) / (1024 * 1024)
-
-                speed_samples.append(speed_mbps)
-                if len(speed_samples) > 10:
-                    speed_samples.pop(0)
-                speed_mbps = sum(speed_samples) / len(speed_samples)
-
-            percentage = min((current_size / expected_size * 100) if expected_size > 0 else 0, 100)
-
-            # Emit progress every 500ms or if percentage changed significantly
-            if (current_time - last_progress_update > 0.5 or
-                abs(percentage - last_progress_update) > 1.0):
-
-                progress_data = {
-                    "type": "progress",
-                    "model": model_name,
-                    "downloaded_bytes": current_size,
-                    "total_bytes": expected_size,
-                    "percentage": round(percentage, 1),
-                    "speed_mbps": round(speed_mbps, 2) if speed_mbps > 0 else 0
-                }
-
-                print(f"PROGRESS:{json.dumps(progress_data)}", file=sys.stderr, flush=True)
-                last_progress_update = percentage
-
-            # Exit if download complete
-            if current_size >= expected_size * 0.95 and current_size > 0:
-                break
+            with os.scandir(current) as entries:
+                for entry in entries:
+                    try:
+                        if entry.is_dir(follow_symlinks=False):
+                            stack.append(entry.path)
+                        else:
+                            total += entry.stat(follow_symlinks=False).st_size
+                    except OSError:
+                        pass
+        except OSError:
+            pass
+    return total
 
-            # Exit if no progress for 30 seconds
-            if current_size == last_size and current_time - last_update_time > 30:
-                if current_size > expected_size * 0.9:
-                    break
+def _blobs_size(blobs_path, settled):
+    """Size of a HF blobs/ directory, only stat-ing blobs that may still change"""
+    # Finished blobs are content-addressed and never change again, so remember
+    # their sizes and only stat *.incomplete files and newly finished blobs
+    total = settled["total"]
+    try:
+        with os.scandir(blobs_path) as entries:
+            for entry in entries:
+                if entry.name in settled["names"]:
+                    continue
+                try:
+                    size = entry.stat(follow_symlinks=False).st_size
+                except OSError:
+                    continue
+                total += size
+                if not entry.name.endswith(".incomplete"):
+                    settled["names"].add(entry.name)
+                    settled["total"] += size
+    except OSError:
+        pass
+    return total
+
+def get_download_size(hf_repo):
+    """Exact number of bytes snapshot_download will fetch, from Hub file metadata"""
+    info = HfApi().model_info(hf_repo, files_metadata=True)
+    files = filter_repo_objects(
+        info.siblings,
+        allow_patterns=DOWNLOAD_ALLOW_PATTERNS,
+        ignore_patterns=DOWNLOAD_IGNORE_PATTERNS,
+        key=lambda sibling: sibling.rfilename
+    )
+    return sum(sibling.size or 0 for sibling in files)
+
+# Byte progress bars snapshot_download created for the current download
+_byte_bars = []
+
+class DownloadByteCounter(hf_tqdm):
+    """huggingface_hub progress bar that also tallies the bytes reported to it"""
+    # Bars are disabled when stderr isn't a TTY and then never advance n,
+    # so keep a separate count
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.bytes_reported = kwargs.get("initial") or 0
+        # Only byte bars count, not snapshot_download's file-count bar
+        if kwargs.get("unit") == "B":
+            _byte_bars.append(self)
+
+    def update(self, n=1):
+        self.bytes_reported += n or 0
+        return super().update(n)
+
+def downloaded_bytes():
+    """Bytes downloaded so far according to snapshot_download's byte bars"""
+    # Some hubs report the same download to more than one bar (bytes received
+    # and bytes written), so take the furthest along rather than the sum
+    return max((bar.bytes_reported for bar in _byte_bars), default=0)
+
+async def monitor_download_progress(model_name, hf_repo):
+    """Report download progress until cancelled by download_model"""
+    # Start from the estimate and switch to the exact total once the Hub
+    # answers, so a slow or failed metadata call never delays or zeroes progress
+    expected_size = ESTIMATED_DOWNLOAD_SIZES.get(model_name, DEFAULT_DOWNLOAD_ESTIMATE)
+    size_lookup = asyncio.ensure_future(run_in_daemon_thread(get_download_size, hf_repo))
+
+    repo_path = _repo_path(hf_repo)
+    blobs_path = os.path.join(repo_path, "blobs")
+    settled_blobs = {"names": set(), "total": 0}
 
-            last_size = current_size
-            last_update_time = current_time
+    last_size = 0
+    last_update_time = time.perf_counter()
+    speed_samples = deque(maxlen=10)
+    last_emit_time = 0
+    last_emit_percentage = 0
 
-        except Exception:
-            pass
+    try:
+        while True:
+            try:
+                if size_lookup is not None and size_lookup.done():
+                    if size_lookup.exception() is None and size_lookup.result() > 0:
+                        expected_size = size_lookup.result()
+                    size_lookup = None
+
+                # Blob sizes can run ahead of received bytes with hf_transfer,
+                # so only poll them on hubs that don't report byte counts
+                if HUB_REPORTS_BYTES:
+                    current_size = downloaded_bytes()
+                else:
+                    current_size = _blobs_size(blobs_path, settled_blobs)
+
+                # Calculate speed
+                current_time = time.perf_counter()
+                time_diff = current_time - last_update_time
+
+                speed_mbps = 0
+                if last_size > 0 and time_diff > 0 and current_size > last_size:
+                    speed_samples.append((current_size - last_size) / time_diff / BYTES_PER_MBPS)
+                    speed_mbps = sum(speed_samples) / len(speed_samples)
+
+                percentage = min((current_size / expected_size * 100) if expected_size > 0 else 0, 100)
+
+                # Emit progress every 500ms or if percentage changed significantly
+                if (current_time - last_emit_time > 0.5 or
+                    abs(percentage - last_emit_percentage) > 1.0):
+
+                    progress_data = {
+                        "type": "progress",
+                        "model": model_name,
+                        "downloaded_bytes": current_size,
+                        "total_bytes": expected_size,
+                        "percentage": round(percentage, 1),
+                        "speed_mbps": round(speed_mbps, 2) if speed_mbps > 0 else 0
+                    }
+
+                    emit_progress(progress_data)
+                    last_emit_time = current_time
+                    last_emit_percentage = percentage
+
+                last_size = current_size
+                last_update_time = current_time
+
+            except Exception:
+                pass
+
+            await asyncio.sleep(0.5)
+    finally:
+        if size_lookup is not None:
+            size_lookup.cancel()
+
+async def run_in_daemon_thread(func, *args, **kwargs):
+    """Await a blocking call run in a daemon thread"""
+    # Unlike asyncio.to_thread, exiting after Ctrl-C doesn't wait for the call
+    loop = asyncio.get_running_loop()
+    future = loop.create_future()
+
+    def settle(setter, value):
+        if not future.done():
+            setter(value)
+
+    def runner():
+        try:
+            outcome = (future.set_result, func(*args, **kwargs))
+        except BaseException as e:
+            # Settle the future on SystemExit etc. too, or the awaiter hangs
+            outcome = (future.set_exception, e)
+        try:
+            loop.call_soon_threadsafe(settle, *outcome)
+        except RuntimeError:
+            pass  # Loop already closed after an interrupt
 
-        time.sleep(0.5)
+    threading.Thread(target=runner, daemon=True).start()
+    return await future
 
-def download_model(model_name="base"):
+async def download_model(model_name=DEFAULT_MODEL):
     """Download MLX Whisper model from HuggingFace with progress tracking"""
-    hf_repo = MODEL_MAPPING.get(model_name, "mlx-community/whisper-base")
+    hf_repo = resolve_model(model_name)
 
-    stop_event = threading.Event()
-    progress_thread = None
+    progress_task = None
 
     try:
-        cache_dir = os.path.expanduser("~/.cache/huggingface/hub")
-        repo_folder = f"models--{hf_repo.replace('/', '--')}"
-        repo_path = os.path.join(cache_dir, repo_folder)
+        repo_path = _repo_path(hf_repo)
 
         # Check if already downloaded
         if os.path.exists(repo_path):
-            size_bytes = sum(
-                os.path.getsize(os.path.join(dirpath, filename))
-                for dirpath, dirnames, filenames in os.walk(repo_path)
-                for filename in filenames
-            )
+            size_bytes = _dir_size(repo_path)
             return {
                 "model": model_name,
                 "downloaded": True,
@@ -272,32 +635,32 @@ def download_model(model_name="base"):
                 "success": True
             }
 
-        # Start progress monitoring in background thread
-        progress_thread = threading.Thread(
-            target=monitor_download_progress,
-            args=(model_name, hf_repo, stop_event),
-            daemon=True
+        _byte_bars.clear()
+        if not HUB_REPORTS_BYTES:
+            print(f"[MLX] huggingface_hub {hub_version} doesn't report download bytes; "
+                  "estimating progress from cache size", file=sys.stderr)
+
+        # Poll progress on the event loop while the download runs off-loop
+        progress_task = asyncio.create_task(
+            monitor_download_progress(model_name, hf_repo)
         )
-        progress_thread.start()
 
         # Download model
-        local_path = snapshot_download(
+        local_path = await run_in_daemon_thread(
+            snapshot_download,
             repo_id=hf_repo,
-            cache_dir=cache_dir,
-            resume_download=True
+            cache_dir=_cache_dir(),
+            allow_patterns=DOWNLOAD_ALLOW_PATTERNS,
+            ignore_patterns=DOWNLOAD_IGNORE_PATTERNS,
+            max_workers=DOWNLOAD_MAX_WORKERS,
+            tqdm_class=DownloadByteCounter
         )
 
         # Stop progress monitoring
-        stop_event.set()
-        if progress_thread and progress_thread.is_alive():
-            progress_thread.join(timeout=1)
-
-        # Get final size
-        size_bytes = sum(
-            os.path.getsize(os.path.join(dirpath, filename))
-            for dirpath, dirnames, filenames in os.walk(local_path)
-            for filename in filenames
-        )
+        progress_task.cancel()
+
+        # Get final size (snapshot entries are symlinks into blobs/, so measure the repo)
+        size_bytes = _dir_size(repo_path)
 
         # Emit completion
         completion_data = {
@@ -307,7 +670,7 @@ def download_model(model_name="base"):
             "total_bytes": size_bytes,
             "percentage": 100
         }
-        print(f"PROGRESS:{json.dumps(completion_data)}", file=sys.stderr, flush=True)
+        emit_progress(completion_data)
 
         return {
             "model": model_name,
@@ -319,16 +682,14 @@ def download_model(model_name="base"):
             "success": True
         }
 
-    except KeyboardInterrupt:
-        stop_event.set()
-        return {
-            "model": model_name,
-            "downloaded": False,
-            "error": "Download interrupted by user",
-            "success": False
-        }
+    except asyncio.CancelledError:
+        # Ctrl-C cancels this task; let asyncio.run raise KeyboardInterrupt
+        if progress_task:
+            progress_task.cancel()
+        raise
     except Exception as e:
-        stop_event.set()
+        if progress_task:
+            progress_task.cancel()
         return {
             "model": model_name,
             "downloaded": False,
@@ -336,21 +697,15 @@ def download_model(model_name="base"):
             "success": False
         }
 
-def check_model_status(model_name="base"):
+def check_model_status(model_name=DEFAULT_MODEL):
     """Check if MLX model is downloaded"""
-    hf_repo = MODEL_MAPPING.get(model_name, "mlx-community/whisper-base")
+    hf_repo = resolve_model(model_name)
 
     try:
-        cache_dir = os.path.expanduser("~/.cache/huggingface/hub")
-        repo_folder = f"models--{hf_repo.replace('/', '--')}"
-        repo_path = os.path.join(cache_dir, repo_folder)
+        repo_path = _repo_path(hf_repo)
 
         if os.path.exists(repo_path):
-            size_bytes = sum(
-                os.path.getsize(os.path.join(dirpath, filename))
-                for dirpath, dirnames, filenames in os.walk(repo_path)
-                for filename in filenames
-            )
+            size_bytes = _dir_size(repo_path)
 
             return {
                 "model": model_name,
@@ -378,33 +733,26 @@ def check_model_status(model_name="base"):
 def list_models():
     """List all MLX models and their status"""
     models = list(MODEL_MAPPING.keys())
-    model_info = []
 
-    for model_name in models:
-        status = check_model_status(model_name)
-        model_info.append(status)
+    # Cache scans are independent and I/O-bound, so run them side by side
+    with ThreadPoolExecutor(max_workers=min(8, len(models))) as executor:
+        model_info = list(executor.map(check_model_status, models))
 
     return {
         "models": model_info,
-        "cache_dir": os.path.expanduser("~/.cache/huggingface/hub"),
+        "cache_dir": _cache_dir(),
         "success": True
     }
 
-def delete_model(model_name="base"):
+def delete_model(model_name=DEFAULT_MODEL):
     """Delete downloaded MLX model"""
-    hf_repo = MODEL_MAPPING.get(model_name, "mlx-community/whisper-base")
+    hf_repo = resolve_model(model_name)
 
     try:
-        cache_dir = os.path.expanduser("~/.cache/huggingface/hub")
-        repo_folder = f"models--{hf_repo.replace('/', '--')}"
-        repo_path = os.path.join(cache_dir, repo_folder)
+        repo_path = _repo_path(hf_repo)
 
         if os.path.exists(repo_path):
-            size_bytes = sum(
-                os.path.getsize(os.path.join(dirpath, filename))
-                for dirpath, dirnames, filenames in os.walk(repo_path)
-                for filename in filenames
-            )
+            size_bytes = _dir_size(repo_path)
 
             shutil.rmtree(repo_path)
 
@@ -430,61 +778,201 @@ def delete_model(model_name="base"):
             "success": False
         }
 
+def handle_request(line, verbose=False):
+    """Handle one newline-delimited JSON request from a serve client"""
+    try:
+        request = _loads(line)
+    except ValueError as e:
+        return {
+            "success": False,
+            "error": f"Invalid request: {str(e)}"
+        }
+
+    if not isinstance(request, dict):
+        return {
+            "success": False,
+            "error": "Invalid request: expected a JSON object"
+        }
+
+    quality = request.get("quality")
+    model = request.get("model")
+    language = request.get("language")
+    if not all(value is None or isinstance(value, str) for value in (quality, model, language)):
+        return {
+            "success": False,
+            "error": "Invalid request: quality, model and language must be strings"
+        }
+
+    if quality is not None and quality not in QUALITY_PROFILE:
+        return {
+            "success": False,
+            "error": f"Invalid request: quality must be one of {', '.join(QUALITY_PROFILE)}"
+        }
+
+    model_name = QUALITY_PROFILE.get(quality) or model or DEFAULT_MODEL
+
+    # Queued clips sent together share one encoder pass
+    audio_files = request.get("audio_files")
+    if audio_files is not None:
+        if not isinstance(audio_files, list) or not all(isinstance(f, str) for f in audio_files):
+            return {
+                "success": False,
+                "error": "Invalid request: audio_files must be a list of paths"
+            }
+        return transcribe_batch(audio_files, model_name, language, verbose)
+
+    audio_file = request.get("audio_file")
+    if not audio_file or not isinstance(audio_file, str):
+        return {
+            "success": False,
+            "error": "Audio file required"
+        }
+
+    return transcribe_audio(
+        audio_file,
+        model_name,
+        language,
+        verbose
+    )
+
+def _raise_keyboard_interrupt(signum, frame):
+    """Signal handler that stops serve() through its Ctrl-C path"""
+    raise KeyboardInterrupt
+
+def serve(socket_path=DEFAULT_SOCKET_PATH, verbose=False):
+    """Run as a long-lived daemon answering JSON line requests on a Unix socket"""
+    os.makedirs(os.path.dirname(socket_path), exist_ok=True)
+    if os.path.exists(socket_path):
+        # Only clear a stale socket left by a crash, never a live daemon's
+        probe = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        try:
+            probe.connect(socket_path)
+        except ConnectionRefusedError:
+            os.unlink(socket_path)
+        except FileNotFoundError:
+            pass
+        else:
+            return {
+                "success": False,
+                "error": f"Another bridge is already serving on {socket_path}"
+            }
+        finally:
+            probe.close()
+
+    # The app stops the daemon with SIGTERM; unwind like Ctrl-C so the socket is removed
+    signal.signal(signal.SIGTERM, _raise_keyboard_interrupt)
+
+    server = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    try:
+        server.bind(socket_path)
+        server.listen(1)
+        print(f"[MLX] Serving on {socket_path}", file=sys.stderr, flush=True)
+
+        while True:
+            conn, _ = server.accept()
+            try:
+                with conn, conn.makefile("rwb") as stream:
+                    for line in stream:
+                        if not line.strip():
+                            continue
+                        try:
+                            result = handle_request(line, verbose)
+                        except Exception as e:
+                            result = {
+                                "success": False,
+                                "error": f"Request failed: {str(e)}"
+                            }
+                        stream.write(_dumpb(result) + b"\n")
+                        stream.flush()
+            except OSError as e:
+                # Client went away mid-request; keep serving others
+                print(f"[MLX] Client connection dropped: {str(e)}", file=sys.stderr)
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.close()
+        if os.path.exists(socket_path):
+            os.unlink(socket_path)
+
+    return {"success": True}
+
 def main():
     parser = argparse.ArgumentParser(description="Official MLX Whisper Bridge with GPU Acceleration")
     parser.add_argument("audio_file", nargs="?", help="Audio file to transcribe")
-    parser.add_argument("--model", default="base", help="Model to use (tiny/base/small/medium/large/turbo/turbo-q4/large-8bit)")
+    parser.add_argument("--model", default=DEFAULT_MODEL, help="Model to use (tiny/base/small/medium/large/turbo/turbo-q4/large-8bit)")
+    parser.add_argument("--quality", default=None, choices=list(QUALITY_PROFILE),
+                       help="Speed/accuracy preset (fast=turbo-q4, balanced=turbo, quality=large-v3); overrides --model")
     parser.add_argument("--language", default=None, help="Language code")
     parser.add_argument("--output-format", default="json", choices=["json", "text"])
     parser.add_argument("--mode", default="transcribe",
-                       choices=["transcribe", "download", "check", "list", "delete", "check-ffmpeg"],
+                       choices=["transcribe", "download", "check", "list", "delete", "check-ffmpeg", "serve"],
                        help="Operation mode")
+    parser.add_argument("--socket", default=DEFAULT_SOCKET_PATH, help="Unix socket path for serve mode")
+    parser.add_argument("--verbose", action="store_true", help="Print full tracebacks on transcription errors")
 
     args = parser.parse_args()
 
+    if args.quality:
+        args.model = QUALITY_PROFILE[args.quality]
+
     # Handle download mode
     if args.mode == "download":
-        result = download_model(args.model)
-        print(json.dumps(result))
+        try:
+            result = asyncio.run(download_model(args.model))
+        except KeyboardInterrupt:
+            result = {
+                "model": args.model,
+                "downloaded": False,
+                "error": "Download interrupted by user",
+                "success": False
+            }
+        print(_dumps(result))
         sys.exit(0 if result.get("success") else 1)
 
     # Handle check mode
     elif args.mode == "check":
         result = check_model_status(args.model)
-        print(json.dumps(result))
+        print(_dumps(result))
         sys.exit(0 if result.get("success") else 1)
 
     # Handle list mode
     elif args.mode == "list":
         result = list_models()
-        print(json.dumps(result))
+        print(_dumps(result))
         sys.exit(0 if result.get("success") else 1)
 
     # Handle delete mode
     elif args.mode == "delete":
         result = delete_model(args.model)
-        print(json.dumps(result))
+        print(_dumps(result))
         sys.exit(0 if result.get("success") else 1)
 
     # Handle check-ffmpeg mode
     elif args.mode == "check-ffmpeg":
         result = check_ffmpeg()
-        print(json.dumps(result))
+        print(_dumps(result))
         sys.exit(0 if result.get("available") else 1)
 
+    # Handle serve mode
+    elif args.mode == "serve":
+        result = serve(args.socket, args.verbose)
+        if not result.get("success"):
+            print(_dumps(result))
+            sys.exit(1)
+
     # Handle transcribe mode
     elif args.mode == "transcribe":
         if not args.audio_file:
-            print(json.dumps({
+            print(_dumps({
                 "success": False,
                 "error": "Audio file required"
             }))
             sys.exit(1)
 
-        result = transcribe_audio(args.audio_file, args.model, args.language)
+        result = transcribe_audio(args.audio_file, args.model, args.language, args.verbose)
 
         if args.output_format == "json":
-            print(json.dumps(result))
+            print(_dumps(result))
         else:
             if result.get("success"):
                 print(result.get("text", ""))